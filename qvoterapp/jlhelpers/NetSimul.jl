@@ -6,7 +6,7 @@ __precompile__()
 
 
 module NetSimul
-export examine_q_voter
+export examine_q_voter, examine_q_voter_batch
 
 using Graphs
 using JLD2
@@ -35,4 +35,26 @@ function examine_q_voter(x::Float64, net_key::String, M::Int64, q::Int64, eps::F
     return collect_system_results(x, model_dict[net_key], M, q, eps, N, args...)
 end
 
+"""
+    examine_q_voter_batch(params_f64, params_i64, net_keys)
+For each of the given parameter sets perform a whole Monte Carlo simulation
+    to find an average decision time and a positive decision probability.
+Allows to simulate many systems with a single call.
+# Arguments
+- `params_f64::Matrix{Float64}`: Rows of `x`, `eps` and `beta` (the last one used only by WS graphs).
+- `params_i64::Matrix{Int64}`: Rows of `M`, `q`, `N` and `k` (the last one used only by BA and WS graphs).
+- `net_keys::Vector{String}`: Types of the desired models' structures.
+# Returns
+- `::Matrix{Float64}`: Rows of average exit times and exit probabilities.
+"""
+function examine_q_voter_batch(params_f64::Matrix{Float64}, params_i64::Matrix{Int64}, net_keys::Vector{String})
+    results = Matrix{Float64}(undef, length(net_keys), 2)
+    for (i, net_key) in enumerate(net_keys)
+        x, eps, beta = params_f64[i, :]
+        M, q, N, k = params_i64[i, :]
+        results[i, :] = examine_q_voter(x, net_key, M, q, eps, N, net_args(net_key, k, beta)...)
+    end
+    return results
+end
+
 end
\ No newline at end of file
@@ -34,4 +34,20 @@ Generate a range of random "binary" opinions.
     arr = ones(Int64, N)
     arr[1:Int64(floor((1 - x) * N))] .= -1
     return shuffle(arr)
+end
+
+"""
+    net_args(net_key, k, beta)
+Select the graph parameters (other than its size) required by the given model.
+# Arguments
+- `net_key::String`: Type of the desired model's structure.
+- `k::Int64`: Graph degree-related parameter (BA and WS).
+- `beta::Float64`: Rewiring probability (WS).
+# Returns
+- `::Tuple`: Parameters describing the system (graph).
+"""
+function net_args(net_key::String, k::Int64, beta::Float64)::Tuple
+    net_key == "BA" && return (k,)
+    net_key == "WS" && return (k, beta)
+    return ()
 end
\ No newline at end of file
@@ -1,5 +1,11 @@
 """A package providing components for q-voter simulation, visualisation & reporting app."""
 
 from pyhelpers.plot import PlotCreator
-from pyhelpers.setapp import QVoterAppError, open_out_dir, open_spec_file, set_logger
+from pyhelpers.setapp import (
+    QVoterAppError,
+    is_interactive,
+    open_out_dir,
+    open_spec_file,
+    set_logger,
+)
 from pyhelpers.simul import SimulCollector
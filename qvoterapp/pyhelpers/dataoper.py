@@ -1,7 +1,9 @@
 """Input parsing and data related features"""
 
+import hashlib
 import json
 import logging
+import os
 from itertools import product
 from pathlib import Path
 from typing import Any, Dict, Tuple, Union
@@ -10,10 +12,16 @@ import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
 from pyhelpers.setapp import FileManagementError, SpecificationError
-from pyhelpers.utils import CompoundVar, assure_direct_params, is_dict_with_keys
+from pyhelpers.utils import CompoundVar, is_dict_with_keys
 
 
 PRECISION = 3
+RANGE_KEYS = frozenset(("start", "step", "stop"))
+COMPOUND_KEYS = frozenset(("params", "operations"))
+SPEC_CACHE_SIZE = 8
+
+# decoded specifications by the hash of the file content (shared by all the managers)
+_spec_cache: Dict[str, dict] = {}
 
 
 class SpecManager:
@@ -29,7 +37,9 @@ class SpecManager:
 
     @staticmethod
     def read_file(spec_path: Path) -> dict:
-        """Read the input json file
+        """Read the input json file. The file is decoded only once per its content
+        in the process, so the repeated reads (e.g. for simulating and for plotting)
+        get the same specification dictionary - it must not be modified
 
         :param spec_path: Path to the input specification file
         :type spec_path: Path
@@ -39,11 +49,18 @@ class SpecManager:
         """
         if not spec_path.is_file():
             raise FileManagementError(f"Config file '{spec_path}' doesn't exist")
-        with open(spec_path, "r", encoding="utf-8") as f:
-            try:
-                plot_scpec = json.load(f)
-            except json.JSONDecodeError:
-                raise FileManagementError("Cannot decode JSON spec file")
+        with open(spec_path, "rb") as f:
+            content = f.read()
+        spec_hash = hashlib.blake2b(content).hexdigest()
+        if spec_hash in _spec_cache:
+            return _spec_cache[spec_hash]
+        try:
+            plot_scpec = json.loads(content.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise FileManagementError("Cannot decode JSON spec file")
+        if len(_spec_cache) >= SPEC_CACHE_SIZE:
+            _spec_cache.clear()
+        _spec_cache[spec_hash] = plot_scpec
         return plot_scpec
 
     @staticmethod
@@ -78,7 +95,7 @@ class SpecManager:
                     f"Value {val} presents an empty list of parameters"
                 )
         # dictionary scenarios
-        elif multiple and is_dict_with_keys(val, ("start", "step", "stop")):
+        elif multiple and is_dict_with_keys(val, RANGE_KEYS):
             reminder = np.round((val["stop"] - val["start"]) % val["step"], PRECISION)
             if reminder == 0 or reminder == val["step"]:
                 parsed_val = np.arange(
@@ -93,7 +110,7 @@ class SpecManager:
                 raise SpecificationError(
                     f"Value {val} presents an empty list of parameters"
                 )
-        elif is_dict_with_keys(val, ("params", "operations")):
+        elif is_dict_with_keys(val, COMPOUND_KEYS):
             parsed_val = CompoundVar(val["params"], val["operations"], val.get("order"))
         elif isinstance(val, dict):
             raise SpecificationError(f"Dictionary value {val} schema not recognized")
@@ -202,7 +219,11 @@ class SpecManager:
             # iterate over groups and add their parameters to lists
             all_plot_rel_params = []
             for group in groups:
-                group: dict
+                if not isinstance(group, dict):
+                    raise SpecificationError(
+                        "'groups' section must contain only dictionaries"
+                    )
+                group = group.copy()  # the specification itself stays untouched
                 single_plot_rel_params = {
                     plot_main_var: self._process_value(
                         group.pop(plot_main_var), multiple=True
@@ -284,18 +305,31 @@ class SpecManager:
         if part_req.empty:
             return part_req
         # do it just if df is not empty
-        part_req_transformed = pd.DataFrame()
-        for rowdict in part_req.to_dict(orient="records"):
-            rowdict_transformed = {
-                colname: assure_direct_params(rowdict, rowdict[colname])
-                for colname in rowdict
-            }
-            # ? not really efficient but the dfs tend to be small
-            part_req_transformed = pd.concat(
-                [part_req_transformed, pd.DataFrame([rowdict_transformed])],
-                ignore_index=True,
-            )
-        return part_req_transformed
+        # evaluate each distinct compound variable of a column on all its rows at once
+        columns_transformed = {}
+        for colname in part_req.columns:
+            cells = part_req[colname].tolist()
+            compound_row_ixx: Dict[CompoundVar, list] = {}
+            for row_ix, cell in enumerate(cells):
+                if isinstance(cell, CompoundVar):
+                    compound_row_ixx.setdefault(cell, []).append(row_ix)
+            for compound_var, row_ixx in compound_row_ixx.items():
+                try:
+                    data = {
+                        param: pd.to_numeric(part_req[param].iloc[row_ixx]).to_numpy()
+                        for param in compound_var.params
+                        if isinstance(param, str) and param in part_req
+                    }
+                except (TypeError, ValueError):
+                    raise SpecificationError(
+                        f"Cannot evaluate a compound value {compound_var}. "
+                        + "Its parameters must be numeric"
+                    )
+                values = compound_var.eval_vec(data, len(row_ixx)).tolist()
+                for row_ix, value in zip(row_ixx, values):
+                    cells[row_ix] = value
+            columns_transformed[colname] = cells
+        return pd.DataFrame(columns_transformed)
 
     @staticmethod
     def _get_part_req_desc(
@@ -469,6 +503,8 @@ class DataManager:
     def __init__(self, data_path: Path) -> None:
         """Initialize an object"""
         self.data_path = data_path
+        # number of rows and columns of the stored data (known after a read or write)
+        self._stored_layout: Union[Tuple[int, list], None] = None
 
     def _read_file(self) -> pd.DataFrame:
         """Read the xml data storage file
@@ -476,7 +512,38 @@ class DataManager:
         :return: Table of the existing (simulated) data
         :rtype: pd.DataFrame
         """
-        return pd.read_xml(self.data_path).set_index("index")
+        data = pd.read_xml(self.data_path).set_index("index")
+        self._stored_layout = (len(data), list(data.columns))
+        return data
+
+    def _append_rows(self, new_data_chunk: pd.DataFrame, n_stored: int) -> None:
+        """Insert new rows at the end of the xml data storage file (before its closing tag),
+        with no rewrite of the existing records
+
+        :param new_data_chunk: A chunk of some freshly simulated data (with the stored columns)
+        :type new_data_chunk: pd.DataFrame
+        :param n_stored: Number of rows already stored in the file
+        :type n_stored: int
+        :raises FileManagementError: If the file has no closing tag of the records
+        """
+        new_data_chunk = new_data_chunk.set_axis(
+            pd.RangeIndex(n_stored, n_stored + len(new_data_chunk))
+        )
+        chunk_xml = new_data_chunk.to_xml()
+        rows_xml = chunk_xml[
+            chunk_xml.index("<data>") + len("<data>") : chunk_xml.rindex("</data>")
+        ].lstrip("\n")
+        with open(self.data_path, "r+b") as file:
+            file_size = file.seek(0, os.SEEK_END)
+            tail_start = file.seek(max(file_size - 256, 0))
+            tail = file.read()
+            closing_pos = tail.rfind(b"</data>")
+            if closing_pos < 0:
+                raise FileManagementError(
+                    f"Data file {self.data_path} damaged. Cannot append new records"
+                )
+            file.seek(tail_start + closing_pos)
+            file.write(rows_xml.encode("utf-8") + tail[closing_pos:])
 
     def get_working_data(self, full_data_req: pd.DataFrame) -> pd.DataFrame:
         """Transform a given requirements table by skipping the rows that are already simulated
@@ -574,19 +641,33 @@ class DataManager:
             for plot_name, plot_req in plot_reqs.items()
         }
 
-    def update_file(self, new_data_chunk: pd.DataFrame) -> None:
-        """Append newly simulated data to the xml data storage file
+    def update_file(
+        self, new_data_chunk: Union[pd.DataFrame, Dict[str, NDArray]]
+    ) -> None:
+        """Append newly simulated data to the xml data storage file.
+        If the stored data has all the new columns (in any order), only the new rows
+        are written, in the stored column order. Otherwise, the whole file is rewritten
 
-        :param new_data_chunk: A chunk of some freshly simulated data
-        :type new_data_chunk: pd.DataFrame
+        :param new_data_chunk: A chunk of some freshly simulated data. It can be given
+            as a table or as a dictionary of the column arrays
+        :type new_data_chunk: Union[pd.DataFrame, Dict[str, NDArray]]
         """
+        if isinstance(new_data_chunk, dict):
+            new_data_chunk = pd.DataFrame(new_data_chunk, copy=False)
+        new_data_chunk = new_data_chunk.round(PRECISION)
         if self.data_path.is_file():
+            if self._stored_layout is None:
+                self._read_file()
+            n_stored, stored_columns = self._stored_layout
+            if set(new_data_chunk.columns) <= set(stored_columns):
+                # same layout as in the file (missing optional columns are left empty)
+                new_data_chunk = new_data_chunk.reindex(columns=stored_columns)
+                self._append_rows(new_data_chunk, n_stored)
+                self._stored_layout = (n_stored + len(new_data_chunk), stored_columns)
+                return
             existing_data = self._read_file()
             data = pd.concat(
-                [
-                    existing_data.round(PRECISION),
-                    new_data_chunk.round(PRECISION),
-                ],
+                [existing_data.round(PRECISION), new_data_chunk],
                 ignore_index=True,
             )
         else:
@@ -594,3 +675,4 @@ class DataManager:
 
         data.reset_index(drop=True, inplace=True)
         data.to_xml(self.data_path)
+        self._stored_layout = (len(data), list(data.columns))
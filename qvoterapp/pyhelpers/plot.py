@@ -13,7 +13,7 @@ import seaborn as sns
 from matplotlib import pyplot as plt
 from pyhelpers.dataoper import DataManager, SpecManager
 from pyhelpers.setapp import FileManagementError, QVoterAppError
-from pyhelpers.utils import CompoundVar, assure_direct_params, simplify_number
+from pyhelpers.utils import CompoundVar, assure_direct_columns, simplify_number
 
 
 class TextTranslatorDict(dict):
@@ -195,6 +195,8 @@ class PlotCreator:
         self.text_config = TextConfig()
         self.text_builder = TextBuilder()
         self.out_dir = self._provide_dir()
+        self._images_dir = Path(self.out_dir, "images")
+        self._tex_path = Path(self.out_dir, "plots.tex")
 
     def _provide_dir(self) -> Path:
         """Create the directories for images & report. Add the timestamp to the name
@@ -221,16 +223,11 @@ class PlotCreator:
         args = self.assets[plot_name]["visual_specs"]["args"]
         vals = self.assets[plot_name]["visual_specs"]["vals"]
         group = self.assets[plot_name]["visual_specs"]["group"]
-        df["__ARGUMENTS__"] = df.apply(
-            lambda rowdict: assure_direct_params(rowdict, args, on_colnames=True),
-            axis=1,
-        )
-        df["__VALUES__"] = df.apply(
-            lambda rowdict: assure_direct_params(rowdict, vals, on_colnames=True),
-            axis=1,
+        df["__ARGUMENTS__"], df["__VALUES__"] = assure_direct_columns(
+            df, [args, vals], on_colnames=True
         )
         if group:
-            df[group] = df[group].apply(simplify_number)
+            df[group] = [simplify_number(n) for n in df[group].tolist()]
 
     def _create_single_plot(self, plot_name: str) -> None:
         """Create a single plot using seaborn/pyplot and save it to the pdf file
@@ -271,9 +268,8 @@ class PlotCreator:
                 ),
             )
         # save the fig
-        filename = f"{plot_name}.pdf"
         plt.savefig(
-            Path(self.out_dir, "images", filename),
+            self._images_dir / f"{plot_name}.pdf",
             bbox_extra_artists=bea,
             bbox_inches="tight",
         )
@@ -362,7 +358,7 @@ class PlotCreator:
             logging.info(f"Plot '{plot_name}' created and saved.")
         tex_figures = "\n\n".join(tex_descs)
         tex_content = self._add_tex_struct(tex_figures)
-        with open(Path(self.out_dir, "plots.tex"), "w", encoding="utf-8") as f:
+        with open(self._tex_path, "w", encoding="utf-8") as f:
             f.write(tex_content)
         logging.info(
             "Tex file with all the plots and description has been added to the same folder."
@@ -1,13 +1,25 @@
 """Functions that set up the environment or perform the app-system comunication actions"""
 
+import atexit
 import logging
 import os
-from logging.handlers import QueueHandler
+import subprocess
+import sys
+import threading
+import time
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler
 from multiprocessing import Queue as mpQueue
 from pathlib import Path
 
+import numpy as np
 from colorlog import ColoredFormatter
 
+LOG_BUFFER_SIZE = 256
+LOG_FLUSH_INTERVAL = 2.0
+
+_logger_set = False
+
 
 class QVoterAppError(Exception):
     """A general App error"""
@@ -33,17 +45,57 @@ class SimulationError(QVoterAppError):
     ...
 
 
-def set_logger() -> None:
+class BlockingQueueHandler(QueueHandler):
+    """A queue handler that waits for a free slot in a bounded queue
+    instead of dropping the record"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record into the queue (blocking if it is full)
+
+        :param record: A log record
+        :type record: logging.LogRecord
+        """
+        self.queue.put(record)
+
+
+def _flush_periodically(handler: logging.Handler, interval: float) -> None:
+    """Flush a handler every given number of seconds (on a daemon thread)
+
+    :param handler: A handler to be flushed
+    :type handler: logging.Handler
+    :param interval: Number of seconds between the flushes
+    :type interval: float
+    """
+
+    def flush_loop() -> None:
+        while True:
+            time.sleep(interval)
+            handler.flush()
+
+    threading.Thread(target=flush_loop, daemon=True).start()
+
+
+def set_logger(debug_color: str = "purple") -> None:
     """Set up a logger to display colorful messages in the terminal
-    and save them also into the file (with timestamps)
+    and save them also into the file (with timestamps).
+    File records are buffered and written in batches (every few seconds,
+    when the buffer is full, on errors and on exit).
+    The handlers are added only once, so the subsequent calls do nothing
+
+    :param debug_color: A color of the debug messages in the terminal, defaults to "purple"
+    :type debug_color: str, optional
     """
+    global _logger_set
+    if _logger_set:
+        return
+    _logger_set = True
     logging.root.setLevel(logging.INFO)
     LOG_FILE = Path("log.log")
     # stream
     formatter = ColoredFormatter(
         "%(log_color)s%(message)s%(reset)s",
         log_colors={
-            "DEBUG": "purple",
+            "DEBUG": debug_color,
             "INFO": "white",
             "WARNING": "yellow",
             "ERROR": "red",
@@ -54,18 +106,25 @@ def set_logger() -> None:
     stream.setFormatter(formatter)
     # file
     formatter = logging.Formatter("%(levelname)s: %(asctime)s | %(message)s")
-    file = logging.FileHandler(LOG_FILE)
+    file = logging.FileHandler(LOG_FILE, mode="a", encoding="utf-8")
     file.setFormatter(formatter)
+    buffered_file = MemoryHandler(
+        capacity=LOG_BUFFER_SIZE, flushLevel=logging.ERROR, target=file
+    )
+    _flush_periodically(buffered_file, LOG_FLUSH_INTERVAL)
+    atexit.register(buffered_file.flush)
     # add handlers
     log = logging.getLogger()
     log.addHandler(stream)
     logging.info(f"All the logs are available in '{LOG_FILE}' file.")
-    log.addHandler(file)
+    log.addHandler(buffered_file)
 
 
+@lru_cache(maxsize=1)
 def ensure_julia_env() -> None:
     """Create a julia project if there is no such
-    and install all the missing julia packages"""
+    and install all the missing julia packages.
+    It is done only once per process, the subsequent calls do nothing"""
     from julia import Main, Pkg
 
     logging.info("Ensuring Julia packages...")
@@ -75,32 +134,105 @@ def ensure_julia_env() -> None:
     logging.info("Julia project ready!")
 
 
+def load_net_simul() -> None:
+    """Activate the julia project and load the net simulation module.
+    Skip it if the module has already been loaded in the current process
+    """
+    from julia import Main, Pkg
+
+    if getattr(Main, "NetSimul", None) is None:
+        Pkg.activate(".")
+        Main.include("qvoterapp/jlhelpers/NetSimul.jl")
+        Main.eval("using .NetSimul")
+
+
+def warm_up_net_simul() -> None:
+    """Run tiny simulations on the synthetic network types (all but FB, which needs data),
+    so that Julia compiles the simulating functions before any real scenario comes.
+    A failed warm-up is only reported, as the real runs will compile the code anyway
+    """
+    from julia import Main
+
+    net_keys = ["BA", "WS", "C"]
+    params_f64 = np.array([[0.5, 0.1, 0.1]] * len(net_keys), dtype=np.float64)
+    params_i64 = np.array([[1, 2, 10, 2]] * len(net_keys), dtype=np.int64)
+    try:
+        Main.examine_q_voter_batch(params_f64, params_i64, net_keys)
+    except Exception as err:
+        logging.warning(f"Julia warm-up failed on process {os.getpid()}: {err}")
+
+
+def setup_worker_logging(q: mpQueue) -> None:
+    """Pass the logs of a child process to the main process through a queue.
+    Only warnings and errors are passed on, unless ``QVOTER_VERBOSE=1`` is set.
+    Any previous queue handler is replaced, so the records are never doubled
+
+    :param q: A multiprocessing queue to store the logs
+    :type q: mpQueue
+    """
+    logger = logging.getLogger()
+    for handler in logger.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    if os.environ.get("QVOTER_VERBOSE") == "1":
+        logger.setLevel(logging.INFO)
+    else:
+        logger.setLevel(logging.WARNING)
+    logger.addHandler(BlockingQueueHandler(q))
+
+
 def init_julia_proc(q: mpQueue) -> None:
-    """Initialize the julia project, load the net simulation module
-    and set up a logging queue handler.
-    Use this function on children processes
+    """Initialize the julia project, load the net simulation module, set up the logging
+    and compile the simulating functions. Use this function on children processes
 
     :param q: A multiprocessing queue to store the logs
     :type q: mpQueue
     """
-    from julia import Main, Pkg
+    load_net_simul()
+    setup_worker_logging(q)
+    warm_up_net_simul()
 
-    Pkg.activate(".")
-    Main.include("qvoterapp/jlhelpers/NetSimul.jl")
-    Main.eval("using .NetSimul")
 
-    queue_handler = QueueHandler(q)
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-    logger.addHandler(queue_handler)
+def is_interactive() -> bool:
+    """Tell if the app can interact with the user. It is not possible if the standard input
+    is not a terminal (e.g. for scheduled runs) or ``QVOTER_NONINTERACTIVE=1`` is set
+
+    :return: Interactions availability
+    :rtype: bool
+    """
+    if os.environ.get("QVOTER_NONINTERACTIVE") == "1":
+        return False
+    return sys.stdin is not None and sys.stdin.isatty()
+
+
+def _system_open_cmd(path: Path, text_editor: bool = False) -> list:
+    """Get the command opening a file or a directory with the system default app
+
+    :param path: Path to the file or directory
+    :type path: Path
+    :param text_editor: Open the file in a text editor - on Windows and macOS the command
+        waits until the editor is closed, while ``xdg-open`` (Linux) returns at once, defaults to False
+    :type text_editor: bool, optional
+    :return: A command (program and its arguments)
+    :rtype: list
+    """
+    if sys.platform == "win32":
+        return ["notepad.exe" if text_editor else "explorer.exe", str(path)]
+    elif sys.platform == "darwin":
+        return ["open", "-W", "-t", str(path)] if text_editor else ["open", str(path)]
+    else:
+        return ["xdg-open", str(path)]
 
 
 def open_spec_file(str_spec_path: str) -> None:
-    """Open the specification file in a Windows notepad
+    """Open the specification file in a text editor (a Windows notepad).
+    Skip the question if the app is not run interactively.
+    The editor is waited for on Windows and macOS only - on Linux it is opened
+    in the background
 
     :param str_spec_path: Path to the plot specification json file
     :type str_spec_path: str
-    :raises QVoterAppError: If the specfication file cannot be create
+    :raises QVoterAppError: If the specfication file cannot be create or opened
     """
     if not Path(str_spec_path).is_file():
         try:
@@ -108,28 +240,46 @@ def open_spec_file(str_spec_path: str) -> None:
                 pass
         except OSError:
             raise QVoterAppError(f"Spec file {str_spec_path} cannot be created")
+    if not is_interactive():
+        return
     open_flag = input("\nDo you want to open the plot specification file? (y/n)\n> ")
     if not open_flag:
         print("[n]")
     if open_flag.upper() == "Y":
         print("Opening the file. Close it when it is ready.")
-        os.system(f"notepad.exe {str_spec_path}")
+        open_cmd = _system_open_cmd(Path(str_spec_path), text_editor=True)
+        try:
+            subprocess.run(open_cmd)
+        except OSError:
+            raise QVoterAppError(
+                f"Cannot open the spec file with '{open_cmd[0]}'. Try to do it manually."
+            )
     else:
         print("As you wish sir/madam. I will NOT open it for you!")
 
 
 def open_out_dir(out_dir: Path) -> None:
-    """Open the results directory in Windows file explorer
+    """Open the results directory in a file explorer (a Windows file explorer).
+    Skip the question if the app is not run interactively
 
     :param out_dir: Path to the specific results sub-directory
     :type out_dir: Path
     :raises QVoterAppError: If the folder cannot be opened
     """
+    if not is_interactive():
+        return
     open_flag = input("\nDo you want to open the output folder? (y/n)\n> ")
     if not open_flag:
         print("[n]")
     if open_flag.upper() == "Y":
         if out_dir.is_dir():
-            os.system(f"explorer.exe {out_dir}")
+            open_cmd = _system_open_cmd(out_dir)
+            try:
+                subprocess.Popen(open_cmd, close_fds=True)
+            except OSError:
+                raise QVoterAppError(
+                    f"Cannot open output folder with '{open_cmd[0]}'. "
+                    + "Try to do it manually."
+                )
         else:
             raise QVoterAppError("Cannot open output folder. Try to do it manually.")
@@ -3,10 +3,14 @@
 import logging
 import multiprocessing
 import os
+import threading
+import time
+from functools import lru_cache
 from logging.handlers import QueueListener
-from multiprocessing import Pool
+from multiprocessing.pool import Pool
 from pathlib import Path
-from typing import Any
+from queue import Empty, Queue
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -14,167 +18,130 @@ from numpy.typing import NDArray
 from pyhelpers.dataoper import DataManager, SpecManager
 from pyhelpers.setapp import SimulationError, ensure_julia_env, init_julia_proc
 
+FLUSH_CHUNKS = 8
+FLUSH_INTERVAL = 2.0
+LOG_QUEUE_SIZE = 10_000
+DISPATCHES_PER_PROCESS = 4
+WORKER_THREADS_VARS = ("OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "JULIA_NUM_THREADS")
+SCENARIO_DTYPE = np.dtype(
+    [
+        ("x", "f8"),
+        ("eps", "f8"),
+        ("beta", "f8"),
+        ("mc_runs", "i8"),
+        ("q", "i8"),
+        ("size", "i8"),
+        ("k", "i8"),
+        ("net_code", "i1"),
+    ]
+)
+
+
+# network parameters (other than the size) passed to julia, in order, with their types
+_NET_ARG_ORDER = {
+    "BA": (("k", "number"),),
+    "WS": (("k", "number"), ("beta", "float_prop")),
+    "C": (),
+    "FB": (),
+}
+NET_KEYS = frozenset(_NET_ARG_ORDER)
+# network type aliases indexed by their codes (used in the scenario arrays)
+NET_TYPES = tuple(_NET_ARG_ORDER)
+_NET_CODES = {net_type: code for code, net_type in enumerate(NET_TYPES)}
+_NET_PARAM_TYPES = dict(arg for net_args in _NET_ARG_ORDER.values() for arg in net_args)
+_NET_PARAM_USERS = {
+    param_key: [
+        net_type
+        for net_type, net_args in _NET_ARG_ORDER.items()
+        if param_key in dict(net_args)
+    ]
+    for param_key in _NET_PARAM_TYPES
+}
+_MODEL_PARAM_TYPES = {
+    "mc_runs": "number",
+    "x": "float_prop",
+    "q": "number",
+    "eps": "float_prop",
+    "size": "number",
+}
+
+
+def _invalid_numbers(col: NDArray) -> NDArray:
+    """Find the values that are not positive integers (vectorized)
+
+    :param col: A raw parameter column
+    :type col: NDArray
+    :return: A mask of the incorrect values
+    :rtype: NDArray
+    """
+    col = col.astype(float)
+    return ~((col >= 1) & (col == np.floor(col)))
 
-class SimulParams:
-    r"""Parameters for one simulation. This class comes along with a set of methods
-    to parse the parameters and represent them
 
-    .. note::
-        You must stick to the `./models.md` guidelines when passing the parameters
-
-    :param mc_runs: Monte Carlo runs number
-    :type mc_runs: int
-    :param x: Initial positive opinions rate in the system
-    :type x: float
-    :param q: Neighbor number parameter
-    :type q: int
-    :param eps: A noise level
-    :type eps: float
-    :param size: Size of a network
-    :type size: int
-    :param net_type: A network type alias
-    :type net_type: str
-    :param \**net_params: Network parameters other than its size
+def _invalid_float_props(col: NDArray) -> NDArray:
+    """Find the values that are not in [0, 1] range (vectorized)
+
+    :param col: A raw parameter column
+    :type col: NDArray
+    :return: A mask of the incorrect values
+    :rtype: NDArray
     """
+    col = col.astype(float)
+    return ~((col >= 0) & (col <= 1))
 
-    def __init__(
-        self,
-        mc_runs: int,
-        x: float,
-        q: int,
-        eps: float,
-        size: int,
-        net_type: str,
-        **net_params,
-    ) -> None:
-        """Initialize a class. Parse all the input parameters"""
-        self.mc_runs: int = self.parse_param(mc_runs, "number")
-        self.x: int = self.parse_param(x, "float_prop")
-        self.q: int = self.parse_param(q, "number")
-        self.eps: float = self.parse_param(eps, "float_prop")
-        self.size: int = self.parse_param(size, "number")
-        self.net_type: str = self.parse_param(net_type, "net_key")
-        self.net_params: dict = self.parse_net_params(net_params, self.net_type)
-
-    @staticmethod
-    def parse_param(param: Any, expected_type: str) -> Any:
-        """Parse one parameter value and validate it
-
-        :param param: A raw value of the parameter
-        :type param: Any
-        :param expected_type: A kind of the given parameter.  Can be 'number' (a positive integer),
-            'float_prop' (a proportion from [0, 1] range) or a 'net_key' (a network type alias)
-        :type expected_type: str
-        :raises SimulationError: If the parameter format is incorrect
-        :return: A safe parameter
-        :rtype: Any
-        """
-        if expected_type == "number":
-            try:
-                param = int(param)
-            except ValueError:
-                raise SimulationError(f"Parameter {param} must be numeric")
-            if param < 1:
-                raise SimulationError(f"Parameter {param} must be positive")
-        elif expected_type == "float_prop":
-            try:
-                param = float(param)
-            except ValueError:
-                raise SimulationError(f"Parameter {param} must be numeric")
-            if param < 0 or param > 1:
-                raise SimulationError(f"Parameter {param} must be in [0, 1] range")
-        elif expected_type == "net_key":
-            try:
-                param = str(param)
-            except ValueError:
-                raise SimulationError(f"Parameter {param} must be a string")
-            if param not in ("BA", "WS", "C", "FB"):
-                raise SimulationError(f"Net type {param} is not allowed")
-        else:
-            raise SimulationError(f"Unknown parameter type '{expected_type}'")
-        return param
-
-    def parse_net_params(self, net_params: dict, net_type: str) -> dict:
-        """Extract the relevant network-related parameters from the dictionary and parse them
-        based on the network type given in the second argument
-
-        :param net_params: Network parameters other than its size
-        :type net_params: dict
-        :param net_type: A network type alias
-        :type net_type: str
-        :raises SimulationError: If a required parameter is missing
-        :return: Parsed network-related parameters
-        :rtype: dict
-        """
-        try:
-            if net_type == "BA":
-                return {"k": self.parse_param(net_params["k"], "number")}
-            if net_type == "WS":
-                return {
-                    "k": self.parse_param(net_params["k"], "number"),
-                    "beta": self.parse_param(net_params["beta"], "float_prop"),
-                }
-            if net_type in ("C", "FB"):
-                return dict()
-        except KeyError as err:
-            raise SimulationError(
-                f"The {err} parameter is required for {net_type} graphs"
-            )
 
-    @property
-    def net_params_julia(self) -> str:
-        """Get the network parameters other than its size as a julia source code
-        to be inserted into the simulating function
+_INVALID_FINDERS = {
+    "number": _invalid_numbers,
+    "float_prop": _invalid_float_props,
+}
 
-        :return: Additional network parameters as a julia source code
-        :rtype: str
-        """
-        if self.net_type == "BA":
-            arg_list = [self.net_params["k"]]
-        if self.net_type == "WS":
-            arg_list = [self.net_params["k"], self.net_params["beta"]]
-        if self.net_type in ("C", "FB"):
-            arg_list = []
-        return "," + ",".join(map(str, arg_list))
-
-    def to_dict(self, formatted: bool = False) -> dict:
-        """Get the dictionary of all the parameters. In the 'formatted' mode the additional
-        net parameters are not the separate values but a formatted julia source code string
-
-        :param formatted: Julia src flag to format the ``net_params`` as a string, defaults to False
-        :type formatted: bool, optional
-        :return: All the simulation parameters
-        :rtype: dict
-        """
-        common_dict_part = {
-            "x": self.x,
-            "net_type": self.net_type,
-            "mc_runs": self.mc_runs,
-            "q": self.q,
-            "eps": self.eps,
-            "size": self.size,
-        }
-        if formatted:
-            return {**common_dict_part, "net_params": self.net_params_julia}
-        else:
-            return {**common_dict_part, **self.net_params}
 
-    def __str__(self) -> str:
-        """Get a text description of an object and all the values it stores
+def _validate_cols(cols: Dict[str, NDArray]) -> None:
+    """Validate the parameters of all the scenarios at once, with the vectorized
+    checks over the parameter columns
 
-        :return: String representation of the parameters
-        :rtype: str
-        """
-        net_params_frmtd = ",".join(
-            [
-                f"{param_key}={param_val}"
-                for param_key, param_val in self.net_params.items()
-            ]
-        )
-        raw_string = f"""q-voter system for {self.net_type}({net_params_frmtd}) network
-            of size N={self.size} with model params: x={self.x}, q={self.q}, eps={self.eps};
-            (M={self.mc_runs} runs)"""
-        return " ".join(raw_string.split())
+    :param cols: Parameter columns of the scenarios
+    :type cols: Dict[str, NDArray]
+    :raises SimulationError: If any scenario parameters are incorrect
+        (the message points to the scenario numbers)
+    """
+    try:
+        net_types = cols["net_type"].astype(str)
+        invalid = {"net_type": ~np.isin(net_types, list(NET_KEYS))}
+        for name, expected_type in _MODEL_PARAM_TYPES.items():
+            invalid[name] = _INVALID_FINDERS[expected_type](cols[name])
+        for name, expected_type in _NET_PARAM_TYPES.items():
+            used = np.isin(net_types, _NET_PARAM_USERS[name])
+            if name in cols:
+                invalid[name] = used & _INVALID_FINDERS[expected_type](cols[name])
+            else:
+                invalid[name] = used
+    except KeyError as err:
+        raise SimulationError(f"The {err} parameter is required")
+    except (TypeError, ValueError) as err:
+        raise SimulationError(f"Parameters must be numeric ({err})")
+    messages = [
+        f"'{name}' in scenarios #{', #'.join(map(str, np.flatnonzero(mask) + 1))}"
+        for name, mask in invalid.items()
+        if mask.any()
+    ]
+    if messages:
+        raise SimulationError(f"Incorrect parameters: {'; '.join(messages)}")
+
+
+@lru_cache(maxsize=None)
+def julia_function(name: str) -> Any:
+    """Get a julia function from the main module. The lookup is done once per process
+    and the function object is reused by the subsequent calls
+
+    :param name: Name of the function
+    :type name: str
+    :return: A callable julia function
+    :rtype: Any
+    """
+    from julia import Main
+
+    return getattr(Main, name)
 
 
 class ResultsDict(dict):
@@ -194,30 +161,80 @@ class ResultsDict(dict):
         return f"T={self['avg_exit_time']}, E={self['exit_proba']}"
 
 
-class SingleSimulation:
-    """A worker that simulates one q-voter scenario using Julia and gathers
-    resulting average exit time and exit probability
+class SimulationBatch:
+    """A worker that simulates multiple q-voter scenarios using a single Julia call and gathers
+    resulting average exit times and exit probabilities.
+    The parameters are passed to Julia as typed arrays (instead of a source code)
+
+    :param scenarios: Parameters for the simulations (an array of ``SCENARIO_DTYPE``)
+    :type scenarios: NDArray
+    """
+
+    def __init__(self, scenarios: NDArray) -> None:
+        """Initialize an object and split the parameters into the arrays of common types"""
+        self.params_f64: NDArray = np.column_stack(
+            [scenarios["x"], scenarios["eps"], scenarios["beta"]]
+        ).astype(np.float64)
+        self.params_i64: NDArray = np.column_stack(
+            [scenarios["mc_runs"], scenarios["q"], scenarios["size"], scenarios["k"]]
+        ).astype(np.int64)
+        self.net_keys: List[str] = [NET_TYPES[code] for code in scenarios["net_code"]]
+
+    def run(self) -> NDArray:
+        """Simulate all the scenarios in Julia
+
+        :return: Average exit times and exit probabilities (a row per scenario)
+        :rtype: NDArray
+        """
+        examine_q_voter_batch = julia_function("examine_q_voter_batch")
+        return np.asarray(
+            examine_q_voter_batch(self.params_f64, self.params_i64, self.net_keys)
+        )
 
 
-    :param simul_params: Parameters for one simulation
-    :type simul_params: SimulParams
+def _run_chunk_worker(chunk: Tuple[NDArray, NDArray]) -> Tuple[NDArray, NDArray]:
+    """Run multiple simulations (a chunk) on a child process. Only the scenarios
+    of the chunk are sent to the process, as a compact ``SCENARIO_DTYPE`` array
+
+    :param chunk: Indices of the scenario rows and the scenarios themselves
+    :type chunk: Tuple[NDArray, NDArray]
+    :return: Indices of the scenario rows and their outcomes
+        (average exit times and exit probabilities)
+    :rtype: Tuple[NDArray, NDArray]
     """
+    chunk_indices, scenarios = chunk
+    results = SimulationBatch(scenarios).run()
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        for ix, (exit_time, exit_proba) in zip(chunk_indices, results):
+            results_dict = ResultsDict(
+                {"avg_exit_time": exit_time, "exit_proba": exit_proba}
+            )
+            logging.info("Simulation #%d finished. Results: %s.", ix + 1, results_dict)
+    return chunk_indices, results
 
-    def __init__(
-        self,
-        simul_params: SimulParams,
-    ) -> None:
-        """Initialize an object"""
-        self.simul_params = simul_params
 
-    def run(self) -> dict:
-        from julia import Main
+def _interleave_batches(items: list, batch_size: int) -> list:
+    """Reorder the items (sorted by cost, descending), so that when they are cut
+    into consecutive batches of the given size, the batches get the costly items
+    in turns (the first batch gets the 1st, (n+1)-th, ... item of n batches)
 
-        jl_statemet = 'examine_q_voter({x}, "{net_type}", {mc_runs}, {q}, {eps}, {size}{net_params})'.format(
-            **self.simul_params.to_dict(formatted=True)
-        )
-        exit_time, exit_proba = Main.eval(jl_statemet)
-        return ResultsDict({"avg_exit_time": exit_time, "exit_proba": exit_proba})
+    :param items: Items sorted by cost
+    :type items: list
+    :param batch_size: Number of the items in a batch (maybe except the last one)
+    :type batch_size: int
+    :return: The reordered items
+    :rtype: list
+    """
+    n_batches = -(-len(items) // batch_size)
+    last_size = len(items) - (n_batches - 1) * batch_size
+    capacities = [batch_size] * (n_batches - 1) + [last_size]
+    batches = [[] for _ in capacities]
+    items_iter = iter(items)
+    for round_ix in range(batch_size):
+        for batch, capacity in zip(batches, capacities):
+            if round_ix < capacity:
+                batch.append(next(items_iter))
+    return [item for batch in batches for item in batch]
 
 
 class SimulCollector:
@@ -244,71 +261,207 @@ class SimulCollector:
         self._data_manager = DataManager(Path(str_data_path))
         full_data_req = SpecManager(Path(str_spec_path)).parse_req()
         self.data: pd.DataFrame = self._data_manager.get_working_data(full_data_req)
+        # column arrays (structure of arrays) used on the simulation hot path
+        self._cols: Dict[str, NDArray] = {
+            name: self.data[name].to_numpy(copy=True) for name in self.data.columns
+        }
+        _validate_cols(self._cols)
+        self._scenarios: NDArray = np.empty(0, dtype=SCENARIO_DTYPE)
+        self._pool: Pool = None
+        self._pool_size: int = 0
+        self._log_queue: multiprocessing.Queue = None
+        self._write_queue: Queue = Queue()
+        self._write_error: Exception = None
+
+    def __del__(self) -> None:
+        """Tear down the process pool on the object destruction"""
+        self.close()
+
+    def close(self) -> None:
+        """Terminate the worker processes (if any were started)"""
+        if getattr(self, "_pool", None) is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def _get_pool(self, n_processes: int) -> Pool:
+        """Get the process pool with a julia env activated on each process.
+        The pool is created once and reused by the subsequent runs
+        (it is recreated only if another number of processes is requested).
+        Children are started from a preloaded fork server where available
+        (spawned otherwise, e.g. on Windows)
+
+        :param n_processes: Number of the worker processes
+        :type n_processes: int
+        :return: A pool of the initialized worker processes
+        :rtype: Pool
+        """
+        if self._pool is not None and self._pool_size != n_processes:
+            self.close()
+        if self._pool is None:
+            # keep the workers single-threaded (the parallelism comes from processes)
+            for threads_var in WORKER_THREADS_VARS:
+                os.environ.setdefault(threads_var, "1")
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                ctx = multiprocessing.get_context("forkserver")
+                ctx.set_forkserver_preload(["julia", "pyhelpers.setapp"])
+            else:
+                ctx = multiprocessing.get_context("spawn")
+            self._log_queue = ctx.Queue(maxsize=LOG_QUEUE_SIZE)
+            self._pool = ctx.Pool(
+                processes=n_processes,
+                initializer=init_julia_proc,
+                initargs=[self._log_queue],
+            )
+            self._pool_size = n_processes
+            # log the pids
+            pids = [str(process.pid) for process in multiprocessing.active_children()]
+            logging.info(
+                f"Julia is being activated on processes [{', '.join(pids)}]..."
+            )
+        return self._pool
 
-    def _run_one(self, ix: int) -> None:
-        """Run a single simulation scenario based on one parameter row
-        in the data table and write the outcomes into that table
-        Log the start & finish info
-
-        :param ix: Index of the scenario row (from 0 to n-1)
-        :type ix: int
+    def _save_chunks(self) -> None:
+        """Take the simulated data chunks from the write queue and update the database with them.
+        Chunks are saved in batches - once per ``FLUSH_CHUNKS`` chunks or ``FLUSH_INTERVAL`` seconds.
+        Work until a ``None`` sentinel is received. Use this method on a separate thread
+        """
+        pending: List[Dict[str, NDArray]] = []
+        n_saved = 0
+        finished = False
+        while not finished:
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(pending) < FLUSH_CHUNKS:
+                try:
+                    chunk_data = self._write_queue.get(
+                        timeout=max(deadline - time.monotonic(), 0)
+                    )
+                except Empty:
+                    break
+                if chunk_data is None:
+                    finished = True
+                    break
+                pending.append(chunk_data)
+            if pending and self._write_error is None:
+                new_data = {
+                    name: np.concatenate([chunk_data[name] for chunk_data in pending])
+                    for name in self._cols
+                }
+                try:
+                    self._data_manager.update_file(new_data)
+                except Exception as err:
+                    self._write_error = err
+                else:
+                    n_saved += len(new_data["avg_exit_time"])
+                    logging.info(f"--- Data saved ({n_saved}/{len(self.data)}).")
+            pending = []
+
+    def _prepare_simulations(self) -> None:
+        """Pack the parameters of all the scenarios into a compact array
+        (in the parent process, before any chunk is sent to the workers).
+        The parameters are already validated, so they are copied column by column.
+        The network types are stored as their codes (indices in ``NET_TYPES``) and
+        the network parameters not used by a given network type are filled with zeros
         """
-        raw_params_dict = self.data.iloc[ix].to_dict()
-        simul_params = SimulParams(**raw_params_dict)
-        logging.info(f"Starting simulation #{ix + 1}: {simul_params}.")
-        results = SingleSimulation(simul_params).run()
-        new_row = {**simul_params.to_dict(), **results}
-        # add results & possibly rewrite the types (it's after SimulParams parsing)
-        self.data.loc[ix, new_row.keys()] = new_row.values()
-        logging.info(f"Simulation #{ix + 1} finished. Results: {results}.")
-
-    def _run_chunk(self, chunk_indices: NDArray) -> None:
-        """Run multiple simulations (a chunk) and update the database
-        with the newly generated outcomes.
-        Log the file update success info
-
-        :param chunk_indices:  Indices of the scenario rows
-            (an array containing numbers from 0 to n-1)
-        :type chunk_indices: NDArray
+        net_types, inverse = np.unique(
+            self._cols["net_type"].astype(str), return_inverse=True
+        )
+        net_codes = np.array([_NET_CODES[net_type] for net_type in net_types])[inverse]
+        self._scenarios = np.zeros(net_codes.size, dtype=SCENARIO_DTYPE)
+        self._scenarios["net_code"] = net_codes
+        for name in _MODEL_PARAM_TYPES:
+            self._scenarios[name] = self._cols[name]
+        for name, net_types_using in _NET_PARAM_USERS.items():
+            if name in self._cols:
+                codes_using = [_NET_CODES[net_type] for net_type in net_types_using]
+                self._scenarios[name] = np.where(
+                    np.isin(net_codes, codes_using), self._cols[name], 0
+                )
+
+    def _split_into_chunks(self) -> List[NDArray]:
+        """Split the scenarios into chunks of a single network type each (so that a worker
+        keeps using the same Julia methods). Within a network type the scenarios are
+        sorted by the network size and interleaved, so that the costly ones are
+        spread over the chunks. The chunks are ordered by their estimated cost
+        (the squared network size times the Monte Carlo runs), descending
+
+        :return: Indices of the scenario rows for each chunk (sorted ascending)
+        :rtype: List[NDArray]
         """
-        [self._run_one(ix) for ix in chunk_indices]
-        self._data_manager.update_file(self.data.iloc[chunk_indices])
-        logging.info(
-            f"--- Data chunk saved (#{chunk_indices.min()+1}-{chunk_indices.max()+1}/{len(self.data)})."
+        net_codes = self._scenarios["net_code"]
+        order = np.lexsort((self._scenarios["size"], net_codes))
+        chunk_indices_list = []
+        for net_code in np.unique(net_codes):
+            group_indices = order[net_codes[order] == net_code]
+            n_chunks = int(np.ceil(group_indices.size / self.chunk_size))
+            chunk_indices_list.extend(
+                np.sort(group_indices[i::n_chunks]) for i in range(n_chunks)
+            )
+        # start with the most costly chunks, so that none of them is left for the end
+        costs = self._scenarios["size"].astype(float) ** 2 * self._scenarios["mc_runs"]
+        chunk_indices_list.sort(
+            key=lambda chunk_indices: costs[chunk_indices].sum(), reverse=True
         )
+        return chunk_indices_list
 
     def _run(self) -> None:
-        """Run all the simulations in separate processes on each the available cpu.
-        In each process activate a julia env and map the simulation chunks
+        """Run all the simulations in separate processes on each cpu available to this process.
+        In each process (of a reusable pool) activate a julia env and map the simulation chunks
 
         :raises SimulationError: If *any* error occurred on a child process
         """
-        data_indices = self.data.index.to_numpy()
-        chunk_indices_list = np.array_split(
-            data_indices, np.ceil(data_indices.size / self.chunk_size)
-        )
-        n_processes = os.cpu_count()
-        multiprocessing.set_start_method("spawn")
+        self._prepare_simulations()
+        chunk_indices_list = self._split_into_chunks()
+        if hasattr(os, "sched_getaffinity"):
+            n_processes = len(os.sched_getaffinity(0))
+        else:
+            n_processes = os.cpu_count()
+        n_processes = min(n_processes, len(chunk_indices_list))
+        pool = self._get_pool(n_processes)
         # logging setup
-        mp_queue = multiprocessing.Queue()
-        queue_listener = QueueListener(mp_queue, *logging.getLogger().handlers)
+        queue_listener = QueueListener(self._log_queue, *logging.getLogger().handlers)
         queue_listener.start()
-        # pool creation
-        with Pool(
-            processes=n_processes, initializer=init_julia_proc, initargs=[mp_queue]
-        ) as pool:
-            # log the pids
-            pids = [str(process.pid) for process in multiprocessing.active_children()]
-            logging.info(
-                f"Julia is being activated on processes [{', '.join(pids)}]..."
+        # saving thread
+        self._write_error = None
+        write_thread = threading.Thread(target=self._save_chunks)
+        write_thread.start()
+        # map the simulations
+        logging.info(f"Launching {len(self.data)} simulations.")
+        n_simulated = 0
+        try:
+            chunks = [
+                (chunk_indices, self._scenarios[chunk_indices])
+                for chunk_indices in chunk_indices_list
+            ]
+            # send the chunks in batches, still leaving a few batches per process;
+            # the batches take the cost-sorted chunks in turns, so that the most
+            # costly ones are not put together on a single process
+            dispatch_size = max(
+                1, len(chunks) // (DISPATCHES_PER_PROCESS * n_processes)
+            )
+            chunks = _interleave_batches(chunks, dispatch_size)
+            for chunk_indices, results in pool.imap_unordered(
+                _run_chunk_worker, chunks, chunksize=dispatch_size
+            ):
+                self._cols["avg_exit_time"][chunk_indices] = results[:, 0]
+                self._cols["exit_proba"][chunk_indices] = results[:, 1]
+                n_simulated += len(chunk_indices)
+                logging.info(
+                    "--- Data chunk simulated (%d/%d).", n_simulated, len(self.data)
+                )
+                self._write_queue.put(
+                    {name: col[chunk_indices] for name, col in self._cols.items()}
+                )
+        except Exception as err:
+            raise SimulationError(err)
+        finally:
+            self._write_queue.put(None)
+            write_thread.join()
+            queue_listener.stop()
+        if self._write_error is not None:
+            raise SimulationError(
+                f"Cannot save the simulated data: {self._write_error}"
             )
-            # map the simulations
-            logging.info(f"Launching {data_indices.size} simulations.")
-            try:
-                pool.map(self._run_chunk, chunk_indices_list)
-            except Exception as err:
-                raise SimulationError(err)
-        queue_listener.stop()
 
     def run(self) -> None:
         """Make sure that all the Julia packages are installed and the environment (project) exist.
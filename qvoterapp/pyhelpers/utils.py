@@ -1,10 +1,365 @@
 """Helper objects and small functions"""
 
 import logging
-from typing import Any, Iterable, List, Union
-
+import math
+import operator
+from collections.abc import Set as AbstractSet
+from functools import lru_cache
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from numpy.typing import NDArray
 from pyhelpers.setapp import SpecificationError
 
+try:
+    import numexpr
+except ImportError:  # optional - only speeds up the evaluations on large columns
+    numexpr = None
+
+# minimal number of rows to evaluate the compound variables with numexpr (if available)
+NUMEXPR_MIN_ROWS = 10000
+
+# codes of the compound variable operations and their Python source operators (by code)
+_OP_IX = {"//": 0, "/": 1, "*": 2, "^": 3}
+_OP_SYMBOLS = ("//", "/", "*", "**")
+_OPS = (operator.floordiv, operator.truediv, operator.mul, operator.pow)
+
+
+# kinds of the RPN (postfix) tokens
+PUSH_ARG, PUSH_CONST, APPLY = 0, 1, 2
+
+
+def _fold_constants(left: list, right: list, op_code: int) -> Union[float, int, None]:
+    """Perform an operation in advance if both its operands are plain constants
+
+    :param left: Tokens of the left operand
+    :type left: list
+    :param right: Tokens of the right operand
+    :type right: list
+    :param op_code: Code of the operation
+    :type op_code: int
+    :return: The operation result or None if it cannot be found in advance
+        (also if it is not a finite number - then it is left for the evaluation time)
+    :rtype: Union[float, int, None]
+    """
+    if len(left) != 1 or len(right) != 1:
+        return None
+    (left_kind, left_value), (right_kind, right_value) = left[0], right[0]
+    if left_kind != PUSH_CONST or right_kind != PUSH_CONST:
+        return None
+    try:
+        result = _OPS[op_code](left_value, right_value)
+        if math.isfinite(result):
+            return result
+    except (ArithmeticError, TypeError, ValueError):
+        pass
+    return None
+
+
+def _build_rpn(params: list, op_codes: List[int], order: List[int]) -> tuple:
+    """Translate a compound variable into the Reverse Polish Notation (postfix) tokens.
+    Symbolic parameters become the consecutive function arguments, numbers become constants.
+    Operations on two constants are performed here, once
+
+    :param params: Parameters (numbers/symbols) being the variable components
+    :type params: list
+    :param op_codes: Codes of the operations performed on the parameters (basic algebra)
+    :type op_codes: List[int]
+    :param order: Order of the operations
+    :type order: List[int]
+    :raises SpecificationError: If a parameter is neither a symbol nor a number
+    :return: Tokens - pairs of a kind (``PUSH_ARG``, ``PUSH_CONST`` or ``APPLY``)
+        and an argument index, a constant or an operation code, respectively
+    :rtype: tuple
+    """
+    # tokens of the already combined groups of parameters (stored at their starts)
+    group_tokens = []
+    n_args = 0
+    for param in params:
+        if isinstance(param, str):
+            group_tokens.append([(PUSH_ARG, n_args)])
+            n_args += 1
+        elif isinstance(param, (float, int)):
+            group_tokens.append([(PUSH_CONST, param)])
+        else:
+            raise SpecificationError(f"Unknown compound parameter '{param}' type")
+    # bitmap of the group starts - the group of a slot starts at the closest set bit
+    # on the left (or at the slot itself); the operations merge the neighbouring groups
+    live = (1 << len(params)) - 1
+    for oper_ix in order:
+        right_slot = oper_ix + 1
+        left_slot = (live & ((1 << right_slot) - 1)).bit_length() - 1
+        folded = _fold_constants(
+            group_tokens[left_slot], group_tokens[right_slot], op_codes[oper_ix]
+        )
+        if folded is not None:
+            group_tokens[left_slot] = [(PUSH_CONST, folded)]
+        else:
+            group_tokens[left_slot] += group_tokens[right_slot]
+            group_tokens[left_slot].append((APPLY, op_codes[oper_ix]))
+        live &= ~(1 << right_slot)
+    return tuple(group_tokens[0])
+
+
+def _unrolled_pow(
+    base: str, exponent: int, atomic: bool, tmp_names: Union[Iterator[str], None]
+) -> str:
+    """Write a small integer power as the multiplications (with the base and the square
+    found once, using the assignment expressions, unless there are no names for them)
+
+    :param base: Expression of the base
+    :type base: str
+    :param exponent: The exponent (2, 3 or 4)
+    :type exponent: int
+    :param atomic: If the base is a plain name (its repetition costs nothing)
+    :type atomic: bool
+    :param tmp_names: Source of the unique names for the intermediate values
+        or None to repeat the expressions instead
+    :type tmp_names: Union[Iterator[str], None]
+    :return: An expression equivalent to ``base ** exponent``
+    :rtype: str
+    """
+    if tmp_names is None:
+        square = f"({base} * {base})"
+        if exponent == 2:
+            return square
+        elif exponent == 3:
+            return f"({square} * {base})"
+        return f"({square} * {square})"
+    if not atomic:
+        base_name = next(tmp_names)
+        first, base = f"({base_name} := {base})", base_name
+    else:
+        first = base
+    if exponent == 2:
+        return f"({first} * {base})"
+    elif exponent == 3:
+        return f"({first} * {base} * {base})"
+    square_name = next(tmp_names)
+    return f"(({square_name} := {first} * {base}) * {square_name})"
+
+
+def _rpn_to_expr(
+    rpn: tuple,
+    arg_names: Sequence[str],
+    const_names: Sequence[str],
+    assign: bool = True,
+) -> str:
+    """Write the compound variable given by its RPN tokens as a single (infix) expression.
+    The powers with the integer constant exponents 2-4 are written as the multiplications
+
+    :param rpn: Tokens of the compound variable in the Reverse Polish Notation
+    :type rpn: tuple
+    :param arg_names: Names of the symbolic parameters (by argument index)
+    :type arg_names: Sequence[str]
+    :param const_names: Names (or literals) of the constants (in the order of the tokens)
+    :type const_names: Sequence[str]
+    :param assign: If the assignment expressions can be used, defaults to True
+    :type assign: bool, optional
+    :return: An expression using the Python operators
+    :rtype: str
+    """
+    const_names = iter(const_names)
+    tmp_names = (f"_t{tmp_ix}" for tmp_ix in count()) if assign else None
+    # expressions and, for the plain names, the constant values (None for arguments)
+    stack = []
+    for kind, value in rpn:
+        if kind == PUSH_ARG:
+            stack.append((arg_names[value], True, None))
+        elif kind == PUSH_CONST:
+            stack.append((next(const_names), True, value))
+        else:
+            right, _, right_const = stack.pop()
+            left, left_atomic, _ = stack.pop()
+            if (
+                value == _OP_IX["^"]
+                and type(right_const) is int
+                and 2 <= right_const <= 4
+            ):
+                expr = _unrolled_pow(left, right_const, left_atomic, tmp_names)
+            else:
+                expr = f"({left} {_OP_SYMBOLS[value]} {right})"
+            stack.append((expr, False, None))
+    return stack[0][0]
+
+
+def _rpn_constants(rpn: tuple) -> Dict[str, Any]:
+    """Get the constants of the compound variable given by its RPN tokens
+    under the names used in the generated expressions (``c0``, ``c1``, ...)
+
+    :param rpn: Tokens of the compound variable in the Reverse Polish Notation
+    :type rpn: tuple
+    :return: Dictionary of the constant names and values
+    :rtype: Dict[str, Any]
+    """
+    consts = [value for kind, value in rpn if kind == PUSH_CONST]
+    return {f"c{const_ix}": value for const_ix, value in enumerate(consts)}
+
+
+def _rpn_arg_names(rpn: tuple) -> List[str]:
+    """Get the names of the symbolic parameters used in the generated expressions
+    (``v0``, ``v1``, ...) of the compound variable given by its RPN tokens
+
+    :param rpn: Tokens of the compound variable in the Reverse Polish Notation
+    :type rpn: tuple
+    :return: Names of the function arguments
+    :rtype: List[str]
+    """
+    n_args = sum(kind == PUSH_ARG for kind, _ in rpn)
+    return [f"v{arg_ix}" for arg_ix in range(n_args)]
+
+
+@lru_cache(maxsize=256)
+def _numexpr_source(rpn: tuple) -> Union[str, None]:
+    """Get the expression of a compound variable given by its RPN tokens for numexpr,
+    using the names ``v0``, ``v1``, ... (arguments) and ``c0``, ``c1``, ... (constants)
+
+    :param rpn: Tokens of the compound variable in the Reverse Polish Notation
+    :type rpn: tuple
+    :return: The expression or None if numexpr may give other results than NumPy
+        (there is a floor division or a power not written as the multiplications)
+    :rtype: Union[str, None]
+    """
+    if (APPLY, _OP_IX["//"]) in rpn:
+        return None
+    expr = _rpn_to_expr(
+        rpn, _rpn_arg_names(rpn), list(_rpn_constants(rpn)), assign=False
+    )
+    return None if "**" in expr else expr
+
+
+@lru_cache(maxsize=256)
+def _compile_function(rpn: tuple) -> Callable:
+    """Generate a Python function evaluating a compound variable given by its RPN tokens.
+    The function takes the values of the symbolic parameters (positionally) and performs
+    all the operations in a single expression. Functions are cached, so the variables
+    of the same structure share one function
+
+    :param rpn: Tokens of the compound variable in the Reverse Polish Notation
+    :type rpn: tuple
+    :return: A function of the symbolic parameter values
+    :rtype: Callable
+    """
+    namespace = _rpn_constants(rpn)
+    arg_names = _rpn_arg_names(rpn)
+    expr = _rpn_to_expr(rpn, arg_names, list(namespace))
+    source = f"def compound_fun({', '.join(arg_names)}):\n    return {expr}\n"
+    exec(compile(source, "<compound variable>", "exec"), namespace)
+    return namespace["compound_fun"]
+
+
+def _is_permutation(order: list, n: int) -> bool:
+    """Check if the list contains each of the numbers 0, ..., n-1 exactly once
+    (marking the seen numbers as the bits of an int)
+
+    :param order: A list to check
+    :type order: list
+    :param n: Length of the permutation
+    :type n: int
+    :return: Info if the list is a permutation
+    :rtype: bool
+    """
+    if len(order) != n:
+        return False
+    seen = 0
+    for ix in order:
+        if not isinstance(ix, int) or not 0 <= ix < n or (seen >> ix) & 1:
+            return False
+        seen |= 1 << ix
+    return True
+
+
+def _param_as_numeric(param: Any, data: dict) -> Union[float, int, NDArray]:
+    """Get the numeric value of a parameted. For the string input try to evaluate
+    it from the data dict provided
+
+    :param param: A parameter or any value
+    :type param: Any
+    :param data: Dictionary of parameter names and values
+    :type data: dict
+    :raises SpecificationError: If a parameter cannot be evaluated (is not found)
+    :return: Numeric value of the parameter
+    :rtype: Union[float, int, NDArray]
+    """
+    if isinstance(param, str):
+        try:
+            return data[param]
+        except KeyError as err:
+            raise SpecificationError(
+                f"Cannot evaluate a compound value. Parameter {err} not found"
+            )
+    elif isinstance(param, (float, int, np.ndarray)):
+        return param
+    else:
+        raise SpecificationError(f"Unknown compound parameter '{param}' type type")
+
+
+def _is_int_array(value: Any) -> bool:
+    """Tell if a value is an array of integers (or booleans)
+
+    :param value: A parameter value or an array of them
+    :type value: Any
+    :return: Info if the value is an integer array
+    :rtype: bool
+    """
+    return isinstance(value, np.ndarray) and value.dtype.kind in "biu"
+
+
+def _as_python_numbers(value: Any) -> Any:
+    """Turn a numeric array into an array of Python numbers (object dtype), so that the
+    operations on it behave like on the single Python values. Other values stay unchanged
+
+    :param value: A parameter value or an array of them
+    :type value: Any
+    :return: The value, with the Python numbers in case of a numeric array
+    :rtype: Any
+    """
+    if isinstance(value, np.ndarray) and value.dtype.kind in "biuf":
+        return value.astype(object)
+    return value
+
+
+def _is_float_column(value: Any, n_rows: int) -> bool:
+    """Check if the value is a whole column of the (double precision) float numbers
+
+    :param value: Any value
+    :type value: Any
+    :param n_rows: Number of the column rows
+    :type n_rows: int
+    :return: True for a float64 array of ``n_rows`` elements
+    :rtype: bool
+    """
+    return (
+        isinstance(value, np.ndarray)
+        and value.dtype == np.float64
+        and value.shape == (n_rows,)
+    )
+
+
+def _unique_rows(values: List[NDArray]) -> Tuple[List[NDArray], NDArray]:
+    """Find the distinct rows (tuples of the values at the same position) of given columns
+
+    :param values: Value arrays (columns) of the same length
+    :type values: List[NDArray]
+    :return: Columns of the distinct rows and the index of the distinct row for each
+        original row
+    :rtype: Tuple[List[NDArray], NDArray]
+    """
+    uniques, codes = [], []
+    for value in values:
+        unique, inverse = np.unique(value, return_inverse=True)
+        uniques.append(unique)
+        codes.append(inverse.reshape(-1))
+    if len(values) == 1:
+        return uniques, codes[0]
+    unique_codes, inverse = np.unique(
+        np.stack(codes, axis=1), axis=0, return_inverse=True
+    )
+    unique_rows = [unique[unique_codes[:, ix]] for ix, unique in enumerate(uniques)]
+    return unique_rows, inverse.reshape(-1)
+
 
 class CompoundVar:
     """A compund variable that consist of more than basic parameter or number
@@ -23,25 +378,33 @@ class CompoundVar:
         self, params: list, operations: list, order: Union[List[int], None] = None
     ) -> None:
         """Initializa an object. Validate the arguments and assign proper order"""
-        self.oper_translator = {
-            "//": lambda a, b: a // b,
-            "/": lambda a, b: a / b,
-            "*": lambda a, b: a * b,
-            "^": lambda a, b: a**b,
-        }
         self._validate_input(params, operations)
         self.params = params
         self.operations = operations
         self.order = list(range(len(operations)))  # default
 
         if isinstance(order, list):
-            if len(order) != len(operations) or sorted(order) != sorted(self.order):
+            if not _is_permutation(order, len(operations)):
                 logging.warning(
                     f"Assigning default order to {self} with original o={order}. "
                     + "Given list had an invalid length or not consecutive elements"
                 )
             else:
                 self.order = order
+        self._op_codes = [_OP_IX[operation] for operation in operations]
+        self._rpn = _build_rpn(self.params, self._op_codes, self.order)
+        self._compiled = _compile_function(self._rpn)
+        self._arg_names = [param for param in self.params if isinstance(param, str)]
+        # the integer columns behave differently than the Python ints only with these
+        self._int_sensitive = any(
+            (APPLY, _OP_IX[operation]) in self._rpn for operation in ("^", "//")
+        )
+        self._set_signature()
+
+    def _set_signature(self) -> None:
+        """Find (once) the signature identifying the variable and its hash value"""
+        self._sig = (tuple(self.params), tuple(self.operations), tuple(self.order))
+        self._hash = hash(self._sig)
 
     def _validate_input(self, params: Any, operations: Any) -> None:
         """Check if the parameters and operations are of a correct type and stik to the natural guidelines
@@ -61,7 +424,7 @@ class CompoundVar:
                 f"Invalid component/operation numbers: p={params},o={operations}"
             )
         for operation in operations:
-            if operation not in self.oper_translator:
+            if operation not in _OP_IX:
                 raise SpecificationError(f"Unknown operation '{operation}'")
 
     @property
@@ -73,61 +436,135 @@ class CompoundVar:
         """
         return self.params[0]
 
-    @staticmethod
-    def _param_as_numeric(param: Any, data: dict) -> Union[float, int]:
-        """Get the numeric value of a parameted. For the string input try to evaluate
-        it from the data dict provided
-
-        :param param: A parameter or any value
-        :type param: Any
-        :param data: Dictionary of parameter names and values
-        :type data: dict
-        :raises SpecificationError: If a parameter cannot be evaluated (is not found)
-        :return:
-        :rtype: Union[float, int]
+    def bind(self, colnames: Sequence[str]) -> List[int]:
+        """Resolve (once) the symbolic parameters to the positions of the given columns,
+        so that the variable can be evaluated on the row tuples, with no name lookups
+
+        :param colnames: Names of the columns (in the order of the row tuple fields)
+        :type colnames: Sequence[str]
+        :raises SpecificationError: If a parameter is not found among the columns
+        :return: Positions of the columns of the consecutive symbolic parameters
+        :rtype: List[int]
         """
-        if isinstance(param, (float, int)):
-            return param
-        elif isinstance(param, str):
-            try:
-                return data[param]
-            except KeyError as err:
-                raise SpecificationError(
-                    f"Cannot evaluate a compound value. Parameter {err} not found"
-                )
-        else:
-            raise SpecificationError(f"Unknown compound parameter '{param}' type type")
+        col_ixx = {colname: col_ix for col_ix, colname in enumerate(colnames)}
+        try:
+            return [col_ixx[name] for name in self._arg_names]
+        except KeyError as err:
+            raise SpecificationError(
+                f"Cannot evaluate a compound value. Parameter {err} not found"
+            )
 
-    def eval(self, data: dict) -> Any:
-        """Find the ultimate value of the compound variable
-        (perform the calculations specified on in init args)
+    def _compute(self, values: list) -> Any:
+        """Perform the calculations on given parameter values
 
-        :param data: Dictionary of parameter names and values (real parameter values)
-        :type data: dict
+        :param values: Numeric values of the symbolic parameters
+        :type values: list
         :raises SpecificationError: If for some (type-related) reason the value cannot be found
         :return: Numerical value of the compound variable
         :rtype: Any
         """
-        values = self.params.copy()
-        popped = []
         try:
-            for oper_ix in self.order:
-                fun = self.oper_translator[self.operations[oper_ix]]
-                curpar_ix_corrected = oper_ix - len(
-                    list(filter(lambda x: x <= oper_ix, popped))
-                )
-                nextpar_ix_corrected = (
-                    oper_ix + 1 - len(list(filter(lambda x: x <= oper_ix + 1, popped)))
-                )
-                values[curpar_ix_corrected] = fun(
-                    self._param_as_numeric(values[curpar_ix_corrected], data),
-                    self._param_as_numeric(values[nextpar_ix_corrected], data),
-                )
-                popped.append(nextpar_ix_corrected)
-                values.pop(nextpar_ix_corrected)
-        except TypeError as err:
+            return self._compiled(*values)
+        except (TypeError, ValueError, ArithmeticError) as err:
             raise SpecificationError(f"Cannot evaluate a compound value: {err}")
-        return values[0]
+
+    def eval_vec(self, data: Dict[str, NDArray], n_rows: int) -> NDArray:
+        """Find the values of the compound variable for many parameter sets at once.
+        The calculations are performed on the whole (NumPy) parameter columns. Only if
+        the integer columns are raised to a power or floor-divided, the Python numbers
+        are used instead, to keep their semantics (e.g. ``size ^ -1`` is a float).
+        Then, the repeated parameter sets are evaluated just once
+
+        :param data: Dictionary of parameter names and their numeric value arrays
+        :type data: Dict[str, NDArray]
+        :param n_rows: Number of the parameter sets (the length of the arrays)
+        :type n_rows: int
+        :raises SpecificationError: If for some (type-related) reason the values cannot be found
+        :return: Numerical values of the compound variable (one per parameter set)
+        :rtype: NDArray
+        """
+        values = [_param_as_numeric(name, data) for name in self._arg_names]
+        if self._int_sensitive and any(map(_is_int_array, values)):
+            # the Python numbers are slow, so each distinct set of them is used once
+            unique_values, inverse = _unique_rows(values)
+            unique_values = [_as_python_numbers(value) for value in unique_values]
+            return self._compute(unique_values)[inverse]
+        if numexpr is not None and n_rows >= NUMEXPR_MIN_ROWS:
+            result = self._eval_numexpr(values, n_rows)
+            if result is not None:
+                return result
+        # as with the Python numbers, a division by zero or an overflow is an error
+        with np.errstate(divide="raise", over="raise", invalid="raise"):
+            return np.broadcast_to(self._compute(values), (n_rows,))
+
+    def _eval_numexpr(self, values: List[NDArray], n_rows: int) -> Union[NDArray, None]:
+        """Evaluate the compound variable with numexpr in one pass over the columns,
+        with no intermediate arrays. It is done only if the result is exactly the same
+        as the NumPy one - for the float columns, with the operations rounded alike
+
+        :param values: Values of the symbolic parameters
+        :type values: List[NDArray]
+        :param n_rows: Number of the parameter sets (the length of the arrays)
+        :type n_rows: int
+        :return: Numerical values of the compound variable or None if they are to be
+            found with NumPy (also if any of them is not finite - to raise the same errors)
+        :rtype: Union[NDArray, None]
+        """
+        source = _numexpr_source(self._rpn)
+        if (
+            source is None
+            or numexpr.use_vml
+            or not values
+            or not all(_is_float_column(value, n_rows) for value in values)
+        ):
+            return None
+        local_dict = dict(zip(_rpn_arg_names(self._rpn), values))
+        local_dict.update(_rpn_constants(self._rpn))
+        try:
+            result = numexpr.evaluate(
+                source, local_dict=local_dict, global_dict={}, optimization="none"
+            )
+        except (KeyError, OverflowError, SyntaxError, TypeError, ValueError):
+            return None
+        return result if np.isfinite(result).all() else None
+
+    def eval_vectorized(self, df: pd.DataFrame) -> NDArray:
+        """Find the values of the compound variable for all the data frame rows at once.
+        The calculations are performed on the whole (numeric) columns
+
+        :param df: Some parameters (one set per row)
+        :type df: pd.DataFrame
+        :raises SpecificationError: If a parameter column is missing or, for some (type-related)
+            reason, the values cannot be found
+        :return: Numerical values of the compound variable (one per row)
+        :rtype: NDArray
+        """
+        try:
+            columns = {name: df[name].to_numpy() for name in self._arg_names}
+        except KeyError as err:
+            raise SpecificationError(
+                f"Cannot evaluate a compound value. Parameter {err} not found"
+            )
+        return self.eval_vec(columns, len(df))
+
+    def __getstate__(self) -> dict:
+        """Get the object state to pickle (with no generated function, which is not picklable)
+
+        :return: Object attributes
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        del state["_compiled"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the object state from a pickle and generate its function again
+
+        :param state: Object attributes
+        :type state: dict
+        """
+        self.__dict__.update(state)
+        self._compiled = _compile_function(self._rpn)
 
     def transform_names(self, fun: callable) -> None:
         """Transform the compound variable parameter names using a given function
@@ -135,7 +572,11 @@ class CompoundVar:
         :param fun: A relatively safe string transformation function
         :type fun: callable
         """
-        self.params = [fun(param) for param in self.params]
+        self.params = [
+            fun(param) if isinstance(param, str) else param for param in self.params
+        ]
+        self._arg_names = [param for param in self.params if isinstance(param, str)]
+        self._set_signature()
 
     def __eq__(self, other) -> bool:
         """Tell if two compound variables are the same based on their parameters, operations
@@ -146,11 +587,7 @@ class CompoundVar:
         :return: Objects equality
         :rtype: bool
         """
-        return (
-            (self.params == other.params)
-            and (self.operations == other.operations)
-            and (self.order == other.order)
-        )
+        return isinstance(other, CompoundVar) and self._sig == other._sig
 
     def __str__(self) -> str:
         """Get a string representation of the object
@@ -166,34 +603,107 @@ class CompoundVar:
         :return: Hash value
         :rtype: int
         """
-        return hash((tuple(self.params), tuple(self.operations), tuple(self.order)))
-
-
-def assure_direct_params(rowdict: dict, value: Any, on_colnames: bool = False) -> Any:
-    """Assure the parameter value or name regardless of its compound/non-compound type
-
-    :param rowdict: Some parameters
-    :type rowdict: dict
-    :param value: Name of the parameter
-    :type value: Any
-    :param on_colnames: Use if the input `value` are is a column name - not a direct 'value', defaults to False
+        return self._hash
+
+
+@lru_cache(maxsize=64)
+def make_row_resolver(
+    values: Tuple[Any, ...], colnames: Tuple[str, ...]
+) -> Callable[[tuple], tuple]:
+    """Generate a function that assures all the given parameter values for a row tuple
+    in a single expression - names are taken directly from the row fields and compound
+    variables are evaluated inline. Resolvers are cached, so it is generated once per spec
+
+    :param values: Parameters - compound variables, column names or direct values
+    :type values: Tuple[Any, ...]
+    :param colnames: Names of the columns (in the order of the row tuple fields)
+    :type colnames: Tuple[str, ...]
+    :raises SpecificationError: If a parameter is not found among the columns
+    :return: A function of the row tuple giving the tuple of safe, direct parameter values
+    :rtype: Callable[[tuple], tuple]
+    """
+    col_ixx = {colname: col_ix for col_ix, colname in enumerate(colnames)}
+    namespace = {}
+    exprs = []
+    try:
+        for value_ix, value in enumerate(values):
+            if isinstance(value, CompoundVar):
+                fields = [f"row[{col_ix}]" for col_ix in value.bind(colnames)]
+                const_names = []
+                for const_name, const in _rpn_constants(value._rpn).items():
+                    const_names.append(f"{const_name}_{value_ix}")
+                    namespace[const_names[-1]] = const
+                exprs.append(_rpn_to_expr(value._rpn, fields, const_names))
+            elif isinstance(value, str):
+                exprs.append(f"row[{col_ixx[value]}]")
+            else:
+                namespace[f"d_{value_ix}"] = value
+                exprs.append(f"d_{value_ix}")
+    except KeyError as err:
+        raise SpecificationError(
+            f"Cannot evaluate a compound value. Parameter {err} not found"
+        )
+    source = f"def resolve(row):\n    return ({', '.join(exprs)},)\n"
+    exec(compile(source, "<row resolver>", "exec"), namespace)
+    return namespace["resolve"]
+
+
+def assure_direct_columns(
+    df: pd.DataFrame, values: Sequence[Any], on_colnames: bool = False
+) -> List[Union[NDArray, pd.Series, Any]]:
+    """Assure the values of many parameters for all the data frame rows at once, regardless of
+    the compound/non-compound parameter type. Compound variables over numeric columns are
+    evaluated on the whole columns. The other ones are evaluated together, in one pass
+    over the rows, using only the columns they require. Either way, the operations follow
+    the Python number semantics and the compound values are given as floats
+
+    :param df: Some parameters (one set per row)
+    :type df: pd.DataFrame
+    :param values: Names of the parameters
+    :type values: Sequence[Any]
+    :param on_colnames: Use if the input `values` are column names - not direct 'values', defaults to False
     :type on_colnames: bool, optional
-    :raises SpecificationError: If the compound variable cannot be evaluated
-    :return: Safe, direct parameter or name
-    :rtype: Any
+    :raises SpecificationError: If a compound variable cannot be evaluated
+    :return: Safe, direct parameter values or names (one item per parameter)
+    :rtype: List[Union[NDArray, pd.Series, Any]]
     """
-    # ! colname is the one that we take value to transform from
-    if isinstance(value, CompoundVar):
+    columns = []
+    row_wise: Dict[int, CompoundVar] = {}
+    needed_cols: Dict[str, None] = {}
+    for value_ix, value in enumerate(values):
+        if isinstance(value, CompoundVar):
+            try:
+                numeric = all(
+                    pd.api.types.is_numeric_dtype(df[col]) for col in value._arg_names
+                )
+            except KeyError:
+                raise SpecificationError(
+                    f"Unknown values assigned to the compound value '{value}' on input"
+                )
+            if numeric:
+                try:
+                    columns.append(np.asarray(value.eval_vectorized(df), dtype=float))
+                except (TypeError, ValueError, ArithmeticError) as err:
+                    raise SpecificationError(f"Cannot evaluate a compound value: {err}")
+                continue
+            row_wise[value_ix] = value
+            needed_cols.update(dict.fromkeys(value._arg_names))
+            columns.append(None)
+        elif on_colnames:
+            columns.append(df[value])
+        else:
+            columns.append(value)
+    if row_wise:
+        resolve = make_row_resolver(tuple(row_wise.values()), tuple(needed_cols))
+        rows = df[list(needed_cols)].itertuples(index=False, name=None)
         try:
-            return value.eval(rowdict)
-        except KeyError:
-            raise SpecificationError(
-                f"Unknown values assigned to the compound value '{value}' on input"
-            )
-    elif on_colnames:
-        return rowdict[value]
-    else:
-        return value
+            resolved = np.array(list(map(resolve, rows)), dtype=float)
+        except (TypeError, ValueError, ArithmeticError) as err:
+            raise SpecificationError(f"Cannot evaluate a compound value: {err}")
+        resolved = resolved.reshape(len(df), len(row_wise))
+        for resolved_ix, value_ix in enumerate(row_wise):
+            columns[value_ix] = resolved[:, resolved_ix]
+    return columns
 
 
 def is_dict_with_keys(obj: Union[dict, Any], keys: Iterable) -> bool:
@@ -201,13 +711,15 @@ def is_dict_with_keys(obj: Union[dict, Any], keys: Iterable) -> bool:
 
     :param obj: A tested object
     :type obj: Union[dict, Any]
-    :param keys: Collection of the required keys
+    :param keys: Collection of the required keys (sets are compared directly)
     :type keys: Iterable
     :return: Info if the conditions are satisfied
     :rtype: bool
     """
     if isinstance(obj, dict):
-        return all(key in obj for key in keys)
+        if not isinstance(keys, AbstractSet):
+            keys = set(keys)
+        return obj.keys() >= keys
     else:
         return False
 
@@ -8,50 +8,62 @@ import logging
 import warnings
 from argparse import ArgumentParser
 
+import pandas as pd
 from colorama import Back, Fore
 from pyhelpers import (
     PlotCreator,
     QVoterAppError,
     SimulCollector,
+    is_interactive,
     open_out_dir,
     open_spec_file,
     set_logger,
 )
 
-parser = ArgumentParser(
-    prog="Q-voter exit time and exit probability simulation & plotting app",
-    description="This is an app created by Mateusz Machaj (2023) to support the research related to the bachelor's thesis.",
-)
-parser.add_argument(
-    "-s",
-    "--only-simulations",
-    action="store_true",
-    help="use if you don't want to automatically create plots",
-)
-parser.add_argument(
-    "-p",
-    "--plot-spec",
-    default="plot.spec.json",
-    help="path to the plot specification file containing all input configutrations",
-)
-parser.add_argument(
-    "-d",
-    "--data-storage",
-    default="data.xml",
-    help="path to the data storage file. It is recommended to use one for all the simulations",
-)
-parser.add_argument(
-    "-c",
-    "--chunk-size",
-    default=5,
-    type=int,
-    help="approximated chunks size (number of simulations) for distrubuted computing",
-)
-parser.add_argument(
-    "--silent",
-    action="store_true",
-    help="do not ask for any interactions",
-)
+warnings.filterwarnings("ignore")
+
+
+def _get_parser() -> ArgumentParser:
+    """Build the command line arguments parser
+
+    :return: The app arguments parser
+    :rtype: ArgumentParser
+    """
+    parser = ArgumentParser(
+        prog="Q-voter exit time and exit probability simulation & plotting app",
+        description="This is an app created by Mateusz Machaj (2023) to support the research related to the bachelor's thesis.",
+    )
+    parser.add_argument(
+        "-s",
+        "--only-simulations",
+        action="store_true",
+        help="use if you don't want to automatically create plots",
+    )
+    parser.add_argument(
+        "-p",
+        "--plot-spec",
+        default="plot.spec.json",
+        help="path to the plot specification file containing all input configutrations",
+    )
+    parser.add_argument(
+        "-d",
+        "--data-storage",
+        default="data.xml",
+        help="path to the data storage file. It is recommended to use one for all the simulations",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-size",
+        default=5,
+        type=int,
+        help="approximated chunks size (number of simulations) for distrubuted computing",
+    )
+    parser.add_argument(
+        "--silent",
+        action="store_true",
+        help="do not ask for any interactions",
+    )
+    return parser
 
 
 def main(
@@ -73,9 +85,11 @@ def main(
     :type data_storage: str
     :param chunk_size: Average chunk size for the simulations
     :type chunk_size: int
-    :param silent: Silent mode flag (user interactions turned off)
+    :param silent: Silent mode flag (user interactions turned off).
+        Turned on automatically if the app is not run interactively
     :type silent: bool
     """
+    silent = silent or not is_interactive()
     hello_msg = "Welcome to the q-voter exit time & exit probability simulation app!"
     print(f"{Fore.CYAN}\n{hello_msg}\n{'-' * len(hello_msg)}{Fore.RESET}")
     if not silent:
@@ -84,8 +98,6 @@ def main(
         input(
             f"{Fore.CYAN}\nAre you ready for some magic? Press {_enter_str} if so!{Fore.RESET}"
         )
-    # logger and the parameters
-    warnings.filterwarnings("ignore")
     # execution
     ## simulation
     print(f"{Fore.CYAN}\n*** SIMULATING ***{Fore.RESET}")
@@ -106,7 +118,9 @@ def main(
 if __name__ == "__main__":
     # prepare a logger and parse the params
     set_logger()
-    args = parser.parse_args()
+    # the app tables are sliced only to be read, so they need no defensive copies
+    pd.options.mode.copy_on_write = True
+    args = _get_parser().parse_args()
     # run the main funtion and handle the errors
     try:
         main(**dict(args._get_kwargs()))
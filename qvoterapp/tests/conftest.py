@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# the app modules are imported as in the app itself (from the ``qvoterapp`` directory)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+from pyhelpers.dataoper import DataManager
+
+
+def _stored_data(data_path):
+    return pd.read_xml(data_path).set_index("index")
+
+
+def test_append_continues_index(tmp_path):
+    data_manager = DataManager(tmp_path / "data.xml")
+    data_manager.update_file({"x": np.array([0.1, 0.2]), "size": np.array([10, 20])})
+    data_manager.update_file({"x": np.array([0.3]), "size": np.array([30])})
+    data = _stored_data(data_manager.data_path)
+    assert list(data.index) == [0, 1, 2]
+    assert list(data["size"]) == [10, 20, 30]
+
+
+def test_append_reordered_columns(tmp_path):
+    data_manager = DataManager(tmp_path / "data.xml")
+    data_manager.update_file(pd.DataFrame({"x": [0.1], "size": [10]}))
+    data_manager.update_file(pd.DataFrame({"size": [20], "x": [0.2]}))
+    data = _stored_data(data_manager.data_path)
+    assert list(data.columns) == ["x", "size"]
+    assert list(data["x"]) == [0.1, 0.2]
+    assert list(data["size"]) == [10, 20]
+
+
+def test_append_missing_optional_column(tmp_path):
+    data_manager = DataManager(tmp_path / "data.xml")
+    data_manager.update_file(pd.DataFrame({"x": [0.1], "k": [4]}))
+    data_manager.update_file(pd.DataFrame({"x": [0.2]}))
+    data = _stored_data(data_manager.data_path)
+    assert list(data.index) == [0, 1]
+    assert data.loc[0, "k"] == 4 and np.isnan(data.loc[1, "k"])
+
+
+def test_new_column_rewrites_file(tmp_path):
+    data_manager = DataManager(tmp_path / "data.xml")
+    data_manager.update_file(pd.DataFrame({"x": [0.1]}))
+    data_manager.update_file(pd.DataFrame({"x": [0.2], "beta": [0.5]}))
+    data = _stored_data(data_manager.data_path)
+    assert list(data.index) == [0, 1]
+    assert list(data.columns) == ["x", "beta"]
+    assert np.isnan(data.loc[0, "beta"]) and data.loc[1, "beta"] == 0.5
+
+
+def test_append_to_file_with_other_ending(tmp_path):
+    data_path = tmp_path / "data.xml"
+    pd.DataFrame({"x": [0.1]}).to_xml(data_path)
+    content = data_path.read_bytes().replace(b"\n", b"\r\n")
+    data_path.write_bytes(content + b"  \r\n")
+    data_manager = DataManager(data_path)
+    data_manager.update_file(pd.DataFrame({"x": [0.2]}))
+    data = _stored_data(data_path)
+    assert list(data.index) == [0, 1]
+    assert list(data["x"]) == [0.1, 0.2]
+    assert data_path.read_bytes().endswith(b"</data>\r\n  \r\n")
@@ -0,0 +1,130 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+from pyhelpers.setapp import SimulationError
+from pyhelpers.simul import (
+    SCENARIO_DTYPE,
+    SimulCollector,
+    _interleave_batches,
+    _validate_cols,
+)
+
+
+def test_interleave_batches_spreads_costly_items():
+    items = list(range(10))
+    interleaved = _interleave_batches(items, 3)
+    assert sorted(interleaved) == items
+    batches = [interleaved[start : start + 3] for start in range(0, 10, 3)]
+    assert batches == [[0, 4, 7], [1, 5, 8], [2, 6, 9], [3]]
+    assert _interleave_batches(items, 1) == items
+
+
+class _FakePool:
+    def __init__(self, processes, initializer, initargs):
+        self.processes = processes
+        self.terminated = False
+
+    def terminate(self):
+        self.terminated = True
+
+    def join(self):
+        pass
+
+
+class _FakeContext:
+    Pool = _FakePool
+
+    def Queue(self, maxsize):
+        return None
+
+    def set_forkserver_preload(self, modules):
+        pass
+
+
+def test_pool_is_recreated_for_another_size(monkeypatch):
+    monkeypatch.setattr(multiprocessing, "get_context", lambda method: _FakeContext())
+    collector = SimulCollector.__new__(SimulCollector)
+    collector._pool = None
+    collector._pool_size = 0
+    pool = collector._get_pool(2)
+    assert collector._get_pool(2) is pool
+    new_pool = collector._get_pool(3)
+    assert pool.terminated and new_pool.processes == 3
+    collector._pool = None
+
+
+def _scenario_cols(**changes):
+    cols = {
+        "net_type": np.array(["BA", "WS", "C"], dtype=object),
+        "mc_runs": np.array([10, 10, 10]),
+        "x": np.array([0.1, 0.5, 1.0]),
+        "q": np.array([3, 4, 5]),
+        "eps": np.array([0.0, 0.2, 0.3]),
+        "size": np.array([50, 100, 150]),
+        "k": np.array([4.0, 6.0, np.nan]),
+        "beta": np.array([np.nan, 0.3, np.nan]),
+    }
+    cols.update({name: np.array(col) for name, col in changes.items()})
+    return cols
+
+
+def test_validate_cols_accepts_correct_scenarios():
+    _validate_cols(_scenario_cols())
+
+
+@pytest.mark.parametrize(
+    "changes, message",
+    [
+        ({"x": [0.1, 1.5, 1.0]}, "'x' in scenarios #2"),
+        ({"eps": [-0.1, 0.2, 0.3]}, "'eps' in scenarios #1"),
+        ({"beta": [np.nan, 1.1, np.nan]}, "'beta' in scenarios #2"),
+        ({"size": [50, 0, -1]}, "'size' in scenarios #2, #3"),
+        ({"q": [3, 0, 2.5]}, "'q' in scenarios #2, #3"),
+        ({"k": [0.0, 6.0, np.nan]}, "'k' in scenarios #1"),
+        ({"k": [4.0, np.nan, np.nan]}, "'k' in scenarios #2"),
+        ({"net_type": ["BA", "XX", "C"]}, "'net_type' in scenarios #2"),
+    ],
+)
+def test_validate_cols_points_to_incorrect_scenarios(changes, message):
+    with pytest.raises(SimulationError, match=message):
+        _validate_cols(_scenario_cols(**changes))
+
+
+def test_validate_cols_requires_parameters():
+    cols = _scenario_cols()
+    del cols["q"]
+    with pytest.raises(SimulationError, match="'q' parameter is required"):
+        _validate_cols(cols)
+    cols = _scenario_cols()
+    del cols["beta"]
+    with pytest.raises(SimulationError, match="'beta' in scenarios #2"):
+        _validate_cols(cols)
+
+
+def test_split_into_chunks():
+    rng = np.random.default_rng(0)
+    scenarios = np.zeros(50, dtype=SCENARIO_DTYPE)
+    scenarios["net_code"] = rng.integers(0, 4, 50)
+    scenarios["size"] = rng.integers(10, 1000, 50)
+    scenarios["mc_runs"] = rng.integers(1, 100, 50)
+    collector = SimulCollector.__new__(SimulCollector)
+    collector._pool = None
+    collector._scenarios = scenarios
+    collector.chunk_size = 4
+    chunk_indices_list = collector._split_into_chunks()
+    all_indices = np.concatenate(chunk_indices_list)
+    assert sorted(all_indices) == list(range(50))
+    assert all(len(chunk_indices) <= 4 for chunk_indices in chunk_indices_list)
+    assert all(
+        len(np.unique(scenarios["net_code"][chunk_indices])) == 1
+        for chunk_indices in chunk_indices_list
+    )
+    costs = [
+        (
+            scenarios["size"][chunk_indices].astype(float) ** 2
+            * scenarios["mc_runs"][chunk_indices]
+        ).sum()
+        for chunk_indices in chunk_indices_list
+    ]
+    assert costs == sorted(costs, reverse=True)
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pyhelpers import utils
+from pyhelpers.setapp import SpecificationError
+from pyhelpers.utils import CompoundVar, assure_direct_columns, make_row_resolver
+
+
+def test_negative_int_exponent_over_int_column():
+    df = pd.DataFrame({"size": [10, 20, 40], "T": [1.0, 2.0, 4.0]})
+    inverse = CompoundVar(["size", -1], ["^"])
+    scaled = CompoundVar(["T", "size", -2], ["*", "^"], [1, 0])
+    args, vals = assure_direct_columns(df, [inverse, scaled], on_colnames=True)
+    np.testing.assert_allclose(args, [0.1, 0.05, 0.025])
+    np.testing.assert_allclose(vals, [1 / 100, 2 / 400, 4 / 1600])
+
+
+def test_int_column_products_do_not_overflow():
+    df = pd.DataFrame({"size": [2**40, 2**41]})
+    squared = CompoundVar(["size", 2], ["^"])
+    (values,) = assure_direct_columns(df, [squared], on_colnames=True)
+    np.testing.assert_allclose(values, [2.0**80, 2.0**82])
+
+
+def test_division_by_zero_is_a_specification_error():
+    df = pd.DataFrame({"size": [0, 1]})
+    with pytest.raises(SpecificationError):
+        assure_direct_columns(df, [CompoundVar([1, "size"], ["/"])])
+
+
+def test_native_arithmetic_without_int_sensitive_operations():
+    compound_var = CompoundVar(["T", "size", 2], ["*", "/"])
+    values = compound_var.eval_vec(
+        {"T": np.array([1.0, 2.0]), "size": np.array([10, 20])}, 2
+    )
+    assert values.dtype == np.float64
+    np.testing.assert_allclose(values, [5.0, 20.0])
+    products = CompoundVar(["size", 3], ["*"]).eval_vec({"size": np.array([1, 2])}, 2)
+    assert products.dtype == np.int64
+
+
+def test_python_ints_only_for_int_sensitive_operations():
+    compound_var = CompoundVar(["size", 2], ["//"])
+    values = compound_var.eval_vec({"size": np.array([3, 5])}, 2)
+    assert values.tolist() == [1, 2]
+    assert all(type(value) is int for value in values.tolist())
+
+
+def test_repeated_parameter_sets_are_evaluated_once(monkeypatch):
+    compound_var = CompoundVar(["size", "q", -1], ["*", "^"], [1, 0])
+    data = {"size": np.array([10, 20, 10, 20, 10]), "q": np.array([2, 3, 2, 3, 4])}
+    n_evaluated = []
+    compiled = compound_var._compiled
+
+    def counting_compiled(*values):
+        n_evaluated.append(len(values[0]))
+        return compiled(*values)
+
+    monkeypatch.setattr(compound_var, "_compiled", counting_compiled)
+    values = compound_var.eval_vec(data, 5)
+    assert n_evaluated == [3]
+    np.testing.assert_allclose(values.astype(float), [5.0, 20 / 3, 5.0, 20 / 3, 2.5])
+
+
+def test_bind_resolves_parameter_positions():
+    compound_var = CompoundVar(["T", "size", 2], ["*", "^"], [1, 0])
+    assert compound_var.bind(["size", "x", "T"]) == [2, 0]
+    with pytest.raises(SpecificationError):
+        compound_var.bind(["size"])
+    resolve = make_row_resolver((compound_var, "x"), ("size", "x", "T"))
+    assert resolve((3, 0.5, 2.0)) == (18.0, 0.5)
+
+
+@pytest.mark.parametrize(
+    "params, ops, order",
+    [
+        (["x", 3, "eps"], ["^", "/"], [0, 1]),
+        (["x", "eps", 4], ["/", "^"], [0, 1]),
+        (["beta", 2, "x", 0.5], ["*", "/", "*"], [0, 1, 2]),
+    ],
+)
+def test_numexpr_gives_numpy_results(monkeypatch, params, ops, order):
+    pytest.importorskip("numexpr")
+    monkeypatch.setattr(utils, "NUMEXPR_MIN_ROWS", 1)
+    rng = np.random.default_rng(0)
+    data = {name: rng.uniform(0.1, 10, 1000) for name in ("x", "eps", "beta")}
+    compound_var = CompoundVar(params, ops, order)
+    columns = [data[name] for name in compound_var._arg_names]
+    assert compound_var._eval_numexpr(columns, 1000) is not None
+    numexpr_values = compound_var.eval_vec(data, 1000)
+    monkeypatch.setattr(utils, "numexpr", None)
+    numpy_values = compound_var.eval_vec(data, 1000)
+    assert numexpr_values.dtype == numpy_values.dtype
+    np.testing.assert_array_equal(numexpr_values, numpy_values)
+
+
+def test_numexpr_falls_back_to_numpy(monkeypatch):
+    pytest.importorskip("numexpr")
+    monkeypatch.setattr(utils, "NUMEXPR_MIN_ROWS", 1)
+    data = {"x": np.array([1.0, 2.0]), "eps": np.array([0.5, 0.0])}
+    with pytest.raises(SpecificationError):
+        CompoundVar(["x", "eps"], ["/"], [0]).eval_vec(data, 2)
+    assert utils._numexpr_source(CompoundVar(["x", 0.5], ["^"], [0])._rpn) is None
+    monkeypatch.setattr(utils, "numexpr", None)
+    values = CompoundVar(["x", 2], ["^"], [0]).eval_vec(data, 2)
+    np.testing.assert_array_equal(values, [1.0, 4.0])